@@ -1,9 +1,17 @@
 import ipywidgets as widgets
 from IPython.display import display, HTML, clear_output
-import pandas as pd # Included as requested, though main data structure is dict
+import pandas as pd # Included as requested, though main data structure is dict; used for benchmark reports
 import random
 import time
 import threading
+import heapq
+import json
+import gc
+import os
+import sys
+import tracemalloc
+from collections import OrderedDict
+from types import MappingProxyType
 
 # --- Game Global Variables ---
 GAME_CREDITS = 1000
@@ -14,12 +22,19 @@ TIME_LIMIT_SECONDS = 0
 START_TIME = 0
 CURRENT_PATIENT = None
 GAME_STATE = "not_started" # "not_started", "playing", "level_complete", "game_over"
+SESSION_LIBRARY = None # Case library version the current game started with
 
 # Patient pools for the current game session, populated at start_game
 remaining_basic_patients = []
 remaining_mid_patients = []
 remaining_advanced_patients = []
 
+# Ward shift mode: several patients are admitted at once, each with its own clock
+WARD_MODE = False
+WARD = None # Ward state for the current shift, created by new_ward()
+WARD_ACTIVE_BED = None # Bed the player is currently treating
+ACUITY_BY_DIFFICULTY = {'Basic': 1, 'Mid-level': 2, 'Advanced': 3}
+
 
 # --- Patient Data ---
 # Structure for each patient case:
@@ -229,6 +244,405 @@ PATIENT_DATA = [
     }
 ]
 
+# --- Case Packs ---
+# Extra cases can be dropped into CASE_PACK_DIR as JSON files, each holding a list of
+# patient cases in the same structure as PATIENT_DATA. A case whose 'id' matches one in an
+# earlier pack (PATIENT_DATA first, then files in name order) replaces it, so a pack can
+# also fix a built-in case.
+#
+# Every reload publishes a new, read-only library version (every level is a MappingProxyType or tuple) by swapping CASE_LIBRARY.
+# A game keeps reading the version it started with (SESSION_LIBRARY) until it ends,
+# so a reload never disrupts play. Only files whose size or mtime changed are re-read,
+# and only the cases they touch are re-indexed.
+# Library structure:
+# {
+#   'version': increasing integer,
+#   'packs': {source: {'stamp': (mtime_ns, size), 'cases': {id: case}, 'error': message if the last read failed}},
+#   'cases': {id: case}, # Winning case for every ID
+#   'by_difficulty': {difficulty: (id, ...)},
+#   'errors': {path: message} # Packs that failed to load; their last good cases stay in play
+# }
+CASE_PACK_DIR = 'case_packs'
+CASE_PACK_POLL_SECONDS = 2
+BUILTIN_PACK = '<builtin>'
+case_library_lock = threading.Lock() # Serializes reloads; readers never need it
+# Stop event of the running watcher. Kept across re-runs of the notebook cell so the old watcher can be stopped.
+case_pack_watcher_stop = globals().get('case_pack_watcher_stop')
+
+def _freeze(value):
+    """Returns a read-only copy of case data so every session can share it safely."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Fields every case needs, with the JSON types they must have (see the PATIENT_DATA structure above)
+CASE_FIELD_TYPES = {
+    'id': str,
+    'theme': str,
+    'difficulty': str,
+    'symptoms': str,
+    'correct_diagnosis': str,
+    'correct_treatment': str,
+    'tests_available': list,
+    'test_results': dict,
+    'test_costs': dict,
+    'over_testing_penalty_per_test': int,
+    'time_bound': bool,
+    'time_limit_seconds': int,
+    'hint': str,
+}
+
+def _validate_case(case):
+    """Raises ValueError if a case pack entry is missing a field or has the wrong type."""
+    if not isinstance(case, dict):
+        raise ValueError("Each patient case must be a JSON object.")
+    case_name = case.get('id', '<no id>')
+    for field, field_type in CASE_FIELD_TYPES.items():
+        if field not in case:
+            raise ValueError(f"Case {case_name}: missing field '{field}'.")
+        value = case[field]
+        # bool is a subclass of int in Python, so True must not pass as a number
+        if not isinstance(value, field_type) or (field_type is int and isinstance(value, bool)):
+            raise ValueError(f"Case {case_name}: field '{field}' must be of type {field_type.__name__}.")
+    if case['difficulty'] not in ACUITY_BY_DIFFICULTY:
+        raise ValueError(f"Case {case_name}: difficulty must be one of {', '.join(ACUITY_BY_DIFFICULTY)}.")
+    for test in case['tests_available']:
+        if not isinstance(test, str):
+            raise ValueError(f"Case {case_name}: test names in 'tests_available' must be strings.")
+        cost = case['test_costs'].get(test)
+        if not isinstance(cost, int) or isinstance(cost, bool):
+            raise ValueError(f"Case {case_name}: test '{test}' needs an integer entry in 'test_costs'.")
+    if not all(isinstance(result, str) for result in case['test_results'].values()):
+        raise ValueError(f"Case {case_name}: every entry in 'test_results' must be a string.")
+
+def _load_pack_file(path):
+    """Reads one case pack file and returns its cases keyed by ID."""
+    with open(path, encoding='utf-8') as pack_file:
+        cases = json.load(pack_file)
+    if not isinstance(cases, list):
+        raise ValueError("A case pack must be a JSON list of patient cases.")
+    for case in cases:
+        _validate_case(case)
+    return {case['id']: _freeze(case) for case in cases}
+
+def _scan_case_packs():
+    """Returns {path: (mtime_ns, size)} for every case pack file in CASE_PACK_DIR."""
+    if not os.path.isdir(CASE_PACK_DIR):
+        return {}
+    found = {}
+    for entry in os.scandir(CASE_PACK_DIR):
+        if entry.is_file() and entry.name.endswith('.json'):
+            stat = entry.stat()
+            found[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+def build_case_library(previous=None):
+    """Builds the next case library version, re-reading only pack files that changed.
+
+    Returns `previous` itself when nothing changed on disk and there is no watcher error to clear.
+    """
+    old_packs = previous['packs'] if previous else {}
+    new_packs = {BUILTIN_PACK: old_packs.get(BUILTIN_PACK) or
+                 MappingProxyType({'stamp': None, 'cases': MappingProxyType({case['id']: _freeze(case) for case in PATIENT_DATA})})}
+    on_disk = _scan_case_packs()
+    for path in sorted(on_disk):
+        old_pack = old_packs.get(path)
+        if old_pack and old_pack['stamp'] == on_disk[path]:
+            new_packs[path] = old_pack
+            continue
+        try:
+            new_packs[path] = MappingProxyType({'stamp': on_disk[path], 'cases': MappingProxyType(_load_pack_file(path))})
+        except (OSError, ValueError) as e:
+            # Keep serving the last good cases; the stamp stops us re-reading a broken file every poll
+            new_packs[path] = MappingProxyType({'stamp': on_disk[path], 'cases': old_pack['cases'] if old_pack else MappingProxyType({}), 'error': str(e)})
+
+    changed = [source for source in set(old_packs) | set(new_packs) if old_packs.get(source) is not new_packs.get(source)]
+    if previous and not changed and CASE_PACK_DIR not in previous['errors']:
+        return previous # A new version is only needed to clear a watcher error
+
+    # Only IDs defined by changed packs can have a different winning case
+    affected_ids = set()
+    for source in changed:
+        for pack in (old_packs.get(source), new_packs.get(source)):
+            if pack:
+                affected_ids.update(pack['cases'])
+
+    cases = dict(previous['cases']) if previous else {}
+    by_difficulty = dict(previous['by_difficulty']) if previous else {}
+    touched_difficulties = set()
+    for case_id in affected_ids:
+        old_case = cases.pop(case_id, None)
+        if old_case:
+            touched_difficulties.add(old_case['difficulty'])
+        for pack in new_packs.values(): # Later packs override earlier ones
+            if case_id in pack['cases']:
+                cases[case_id] = pack['cases'][case_id]
+        if case_id in cases:
+            touched_difficulties.add(cases[case_id]['difficulty'])
+    for difficulty in touched_difficulties:
+        kept = [case_id for case_id in by_difficulty.get(difficulty, ()) if case_id not in affected_ids]
+        added = [case_id for case_id in affected_ids if case_id in cases and cases[case_id]['difficulty'] == difficulty]
+        by_difficulty[difficulty] = tuple(kept + sorted(added))
+
+    return MappingProxyType({
+        'version': previous['version'] + 1 if previous else 1,
+        'packs': MappingProxyType(new_packs),
+        'cases': MappingProxyType(cases),
+        'by_difficulty': MappingProxyType(by_difficulty),
+        'errors': MappingProxyType({source: pack['error'] for source, pack in new_packs.items() if 'error' in pack}),
+    })
+
+def reload_case_packs():
+    """Picks up changed case packs and publishes the new library version."""
+    global CASE_LIBRARY
+    with case_library_lock:
+        CASE_LIBRARY = build_case_library(CASE_LIBRARY) # A single reference swap, so readers never see a half-built library
+    return CASE_LIBRARY
+
+def _record_case_pack_error(message):
+    """Publishes a library version that reports a reload failure under CASE_PACK_DIR."""
+    global CASE_LIBRARY
+    with case_library_lock:
+        if CASE_LIBRARY['errors'].get(CASE_PACK_DIR) == message:
+            return # Already reported; don't bump the version on every poll
+        library = dict(CASE_LIBRARY)
+        library['errors'] = MappingProxyType(dict(library['errors'], **{CASE_PACK_DIR: message}))
+        library['version'] += 1
+        CASE_LIBRARY = MappingProxyType(library)
+
+def _case_pack_watch_loop(stop_event):
+    """Polls CASE_PACK_DIR and reloads case packs when files change, until stop_event is set."""
+    while not stop_event.wait(CASE_PACK_POLL_SECONDS):
+        try:
+            reload_case_packs()
+        except Exception as e: # Never let one bad reload stop hot reloading for the rest of the process
+            _record_case_pack_error(f"Reload failed: {e!r}")
+
+def start_case_pack_watcher():
+    """Starts the background thread that hot-reloads case packs."""
+    global case_pack_watcher_stop
+    if case_pack_watcher_stop:
+        case_pack_watcher_stop.set() # Stop the previous watcher instead of leaking it
+    case_pack_watcher_stop = threading.Event()
+    watcher_thread = threading.Thread(target=_case_pack_watch_loop, args=(case_pack_watcher_stop,))
+    watcher_thread.daemon = True # Allow program to exit even if thread is running
+    watcher_thread.start()
+
+CASE_LIBRARY = build_case_library()
+
+# --- Shared Artifact Cache ---
+# HTML panels, dropdown options and normalized answers depend only on the case, so every
+# session can share them. Entries are keyed by (case id, library version, artifact kind),
+# which means a hot-reloaded case never serves stale artifacts. The cache is a plain dict:
+# {
+#   'entries': OrderedDict of key -> (value, size_bytes), least recently used first,
+#   'in_flight': {key: {'done': threading.Event, 'value': ..., 'ok': bool}} for artifacts being built,
+#   'lock': guards everything above plus the byte count and stats,
+#   'budget_bytes': entries are evicted LRU-first once 'used_bytes' exceeds this,
+#   'used_bytes': estimated size of all cached values,
+#   'stats': {'hits', 'misses', 'coalesced', 'evictions'}
+# }
+# Single-flight: when several sessions miss on the same key at once, only the first builds
+# the artifact and the rest wait for its result ('coalesced').
+ARTIFACT_CACHE_BUDGET_BYTES = 4 * 1024 * 1024
+
+def new_artifact_cache(budget_bytes=ARTIFACT_CACHE_BUDGET_BYTES):
+    """Creates an empty artifact cache with the given byte budget."""
+    return {
+        'entries': OrderedDict(),
+        'in_flight': {},
+        'lock': threading.Lock(),
+        'budget_bytes': budget_bytes,
+        'used_bytes': 0,
+        'stats': {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0},
+    }
+
+def _artifact_size(value):
+    """Estimates the memory held by an artifact, including nested strings and containers."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        size += sum(_artifact_size(key) + _artifact_size(item) for key, item in value.items())
+    elif isinstance(value, (tuple, list)):
+        size += sum(_artifact_size(item) for item in value)
+    return size
+
+def artifact_cache_get(cache, key, compute):
+    """Returns the cached value for key, building it with compute() on a miss."""
+    with cache['lock']:
+        entry = cache['entries'].get(key)
+        if entry is not None:
+            cache['entries'].move_to_end(key)
+            cache['stats']['hits'] += 1
+            return entry[0]
+        flight = cache['in_flight'].get(key)
+        if flight is None:
+            flight = {'done': threading.Event(), 'value': None, 'ok': False}
+            cache['in_flight'][key] = flight
+            cache['stats']['misses'] += 1
+            leader = True
+        else:
+            cache['stats']['coalesced'] += 1
+            leader = False
+
+    if not leader:
+        flight['done'].wait()
+        if flight['ok']:
+            return flight['value']
+        return artifact_cache_get(cache, key, compute) # The builder failed; try again ourselves
+
+    try:
+        value = compute()
+        flight['value'], flight['ok'] = value, True
+    finally:
+        with cache['lock']:
+            del cache['in_flight'][key]
+            if flight['ok']:
+                size = _artifact_size(value)
+                if size <= cache['budget_bytes']: # Anything bigger is returned but never cached
+                    cache['entries'][key] = (value, size)
+                    cache['used_bytes'] += size
+                    while cache['used_bytes'] > cache['budget_bytes']:
+                        _, (_, evicted_size) = cache['entries'].popitem(last=False)
+                        cache['used_bytes'] -= evicted_size
+                        cache['stats']['evictions'] += 1
+        flight['done'].set()
+    return value
+
+def artifact_cache_stats(cache):
+    """Returns a snapshot of hit/miss/eviction counts and memory use."""
+    with cache['lock']:
+        stats = dict(cache['stats'])
+        stats['entries'] = len(cache['entries'])
+        stats['used_bytes'] = cache['used_bytes']
+        stats['budget_bytes'] = cache['budget_bytes']
+    lookups = stats['hits'] + stats['misses'] + stats['coalesced']
+    stats['hit_rate'] = (stats['hits'] + stats['coalesced']) / lookups if lookups else 0.0
+    return stats
+
+def _build_patient_panel_html(patient):
+    """Builds the patient case panel shown by display_patient_info."""
+    return f"""
+            <div style="border: 1px solid #cce; padding: 15px; border-radius: 12px; background-color: #eef; font-family: 'Inter', sans-serif; box-shadow: 2px 2px 5px rgba(0,0,0,0.1);">
+                <h3 style="margin-top: 0; color: #336; text-align: center; font-size: 1.3em;">Patient Case: {patient['id']} - {patient['theme']} (Difficulty: {patient['difficulty']})</h3>
+                <p style="font-size: 1.1em; line-height: 1.5;"><strong>Initial Symptoms:</strong> {patient['symptoms']}</p>
+                <div style="margin-top: 15px;">
+                    <p style="font-weight: bold; font-size: 1.1em;">Available Tests (Cost):</p>
+                    <ul style="list-style-type: none; padding-left: 0;">
+                        {''.join([f"<li style='margin-bottom: 5px;'>🔬 {test} <span style='color: #888;'>($<span style='font-weight: bold;'>{patient['test_costs'][test]}</span>)</span></li>" for test in patient['tests_available']])}
+                    </ul>
+                </div>
+                <p style="font-style: italic; color: #555; font-size: 0.9em; margin-top: 15px;">
+                    (Hint: Be careful with over-testing! Each unnecessary test will cost you credits if your final diagnosis/treatment is wrong. Focus on relevant tests.)
+                </p>
+            </div>
+            """
+
+def _build_test_options(patient):
+    """Builds the test dropdown options."""
+    return tuple(patient['tests_available'])
+
+def _build_test_result_html(patient):
+    """Builds the formatted result block for every test that has a result."""
+    return MappingProxyType({test_name: f"""
+            <div style="border: 1px solid #d4edda; padding: 15px; margin-top: 15px; border-radius: 12px; background-color: #e6faed; font-family: 'Inter', sans-serif; color: #155724; box-shadow: 2px 2px 5px rgba(0,0,0,0.1);">
+                <p style="font-weight: bold; font-size: 1.1em;">{test_name} Results:</p>
+                <p style="font-size: 1em; line-height: 1.4;">{result}</p>
+            </div>
+            """ for test_name, result in patient['test_results'].items()})
+
+def _build_normalized_answers(patient):
+    """Builds the lowercased answers that submissions are compared against."""
+    return MappingProxyType({
+        'diagnosis': patient['correct_diagnosis'].strip().lower(),
+        'treatment': patient['correct_treatment'].strip().lower(),
+    })
+
+ARTIFACT_BUILDERS = {
+    'patient_panel_html': _build_patient_panel_html,
+    'test_options': _build_test_options,
+    'test_result_html': _build_test_result_html,
+    'normalized_answers': _build_normalized_answers,
+}
+
+ARTIFACT_CACHE = new_artifact_cache() # Shared by every session in this process
+
+def case_artifact(patient, kind, library_version=None, cache=None):
+    """Returns a shared artifact for a case, built once per case, library version and kind."""
+    if library_version is None:
+        library_version = SESSION_LIBRARY['version'] if SESSION_LIBRARY else CASE_LIBRARY['version']
+    cache = ARTIFACT_CACHE if cache is None else cache
+    return artifact_cache_get(cache, (patient['id'], library_version, kind), lambda: ARTIFACT_BUILDERS[kind](patient))
+
+def _run_benchmark_sessions(sessions, mode, cases, library_version, actions_per_session, cache):
+    """Plays simulated sessions in parallel threads and returns the artifacts each still holds.
+
+    Like a real game, a session keeps only the artifacts of its current patient and drops
+    the previous patient's when it moves on.
+    """
+    held = [None] * sessions
+    start_barrier = threading.Barrier(sessions)
+
+    def play_session(session_index):
+        rng = random.Random(session_index)
+        start_barrier.wait()
+        for _ in range(actions_per_session):
+            patient = rng.choice(cases)
+            if mode == 'uncached':
+                held[session_index] = {kind: build(patient) for kind, build in ARTIFACT_BUILDERS.items()}
+            else:
+                held[session_index] = {kind: case_artifact(patient, kind, library_version, cache) for kind in ARTIFACT_BUILDERS}
+
+    threads = [threading.Thread(target=play_session, args=(i,)) for i in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return held
+
+def run_artifact_cache_benchmark(concurrency_levels=(1, 10, 50, 200), actions_per_session=20):
+    """Simulates concurrent sessions with and without the shared cache.
+
+    Returns a pandas DataFrame with CPU time and retained artifact memory per session for
+    each concurrency level. CPU is timed in one pass with nothing but the session work in
+    the timed region. Memory is measured with tracemalloc in a second pass, because tracing
+    slows every allocation. It counts what is still allocated once every session has finished,
+    i.e. the artifacts sessions hold plus, for the shared cache, the cache itself.
+    Run it from a notebook cell; it does not touch the game UI.
+    """
+    library = CASE_LIBRARY
+    cases = list(library['cases'].values())
+    rows = []
+    for sessions in concurrency_levels:
+        for mode in ('uncached', 'shared cache'):
+            cache = new_artifact_cache()
+            cpu_start = time.process_time()
+            held = _run_benchmark_sessions(sessions, mode, cases, library['version'], actions_per_session, cache)
+            cpu_seconds = time.process_time() - cpu_start
+            stats = artifact_cache_stats(cache)
+            del held
+
+            gc.collect()
+            tracemalloc.start()
+            memory_cache = new_artifact_cache()
+            held = _run_benchmark_sessions(sessions, mode, cases, library['version'], actions_per_session, memory_cache)
+            gc.collect()
+            retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del held, memory_cache
+
+            rows.append({
+                'sessions': sessions,
+                'mode': mode,
+                'cpu_ms_per_session': 1000 * cpu_seconds / sessions,
+                'retained_kb_per_session': retained_bytes / 1024 / sessions,
+                'peak_kb_per_session': peak_bytes / 1024 / sessions,
+                'hit_rate': stats['hit_rate'] if mode == 'shared cache' else 0.0,
+                'evictions': stats['evictions'],
+            })
+    return pd.DataFrame(rows)
+
 # --- UI Widgets ---
 game_output = widgets.Output() # Displays game messages and test results
 status_output = widgets.Output() # Displays game credits, hints, level, score, and time
@@ -245,6 +659,8 @@ treat_button = widgets.Button(description="Administer Treatment", button_style='
                               layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
 order_test_button = widgets.Button(description="Order Test", button_style='primary', disabled=True,
                                    layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
+ward_button = widgets.Button(description="Start Ward Shift", button_style='danger',
+                             layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
 
 # Dropdowns/Text inputs for actions
 test_dropdown = widgets.Dropdown(options=[], description="Order Test:", disabled=True,
@@ -253,6 +669,8 @@ diagnosis_input = widgets.Text(description="Diagnosis:", placeholder="e.g., Iron
                                layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
 treatment_input = widgets.Text(description="Treatment:", placeholder="e.g., Oral Iron Supplements", disabled=True,
                                layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
+ward_dropdown = widgets.Dropdown(options=[], description="Ward:", disabled=True,
+                                 layout=widgets.Layout(width='auto', flex='1 1 auto', margin='5px'))
 
 # Main game container
 game_container = widgets.VBox([])
@@ -261,6 +679,68 @@ game_container = widgets.VBox([])
 timer_thread = None
 timer_stop_event = threading.Event()
 
+# --- Ward Shift Priority Queue ---
+# A ward is a plain dict. The notebook UI drives a single ward through the WARD global,
+# so one process hosts one player's shift:
+# {
+#   'queue': heap of (deadline, -acuity, bed_id) entries; discharged beds are skipped lazily,
+#   'beds': {bed_id: bed dict},
+#   'next_bed_id': counter used to number beds in admission order,
+#   'lock': guards 'queue' and 'beds', which the timer thread and the UI both touch
+# }
+# Deadlines are absolute timestamps, so the triage order never changes while the clock runs.
+# Each timer tick only looks at the top of the heap, keeping it O(1) no matter how many patients are on the ward.
+
+def new_ward():
+    """Creates an empty ward for a new shift."""
+    return {'queue': [], 'beds': {}, 'next_bed_id': 1, 'lock': threading.Lock()}
+
+def ward_admit(ward, patient, now=None):
+    """Admits a patient case to the ward and returns its bed ID."""
+    now = time.time() if now is None else now
+    deadline = now + patient['time_limit_seconds'] if patient['time_bound'] else float('inf')
+    acuity = ACUITY_BY_DIFFICULTY.get(patient['difficulty'], 0)
+    with ward['lock']:
+        bed_id = ward['next_bed_id']
+        ward['next_bed_id'] += 1
+        ward['beds'][bed_id] = {
+            'bed_id': bed_id,
+            'patient': patient,
+            'admitted_at': now,
+            'deadline': deadline,
+            'acuity': acuity,
+            'phase': 'diagnosis', # 'diagnosis' until a correct diagnosis is made, then 'treatment'
+        }
+        heapq.heappush(ward['queue'], (deadline, -acuity, bed_id))
+    return bed_id
+
+def ward_discharge(ward, bed_id):
+    """Removes a patient from the ward. Its queue entry is dropped lazily by ward_peek."""
+    with ward['lock']:
+        ward['beds'].pop(bed_id, None)
+
+def ward_peek(ward):
+    """Returns the most urgent bed on the ward, or None if the ward is empty."""
+    with ward['lock']:
+        queue = ward['queue']
+        while queue and queue[0][2] not in ward['beds']:
+            heapq.heappop(queue) # Discard entries for discharged patients
+        return ward['beds'][queue[0][2]] if queue else None
+
+def ward_first_expired(ward, now=None):
+    """Returns the most urgent bed whose deadline has passed, or None."""
+    now = time.time() if now is None else now
+    bed = ward_peek(ward)
+    if bed and bed['deadline'] <= now:
+        return bed
+    return None
+
+def ward_triage_order(ward):
+    """Returns all beds ordered by time-to-deadline, then acuity (highest first)."""
+    with ward['lock']:
+        beds = list(ward['beds'].values())
+    return sorted(beds, key=lambda bed: (bed['deadline'], -bed['acuity'], bed['bed_id']))
+
 # --- Functions ---
 
 def update_status_display():
@@ -282,6 +762,13 @@ def update_status_display():
             minutes, seconds = divmod(int(time_left), 60)
             time_color = 'red' if time_left < 60 else 'green'
             html_content += f"<p style='margin: 5px 10px;'><strong>Time Left:</strong> <span style='color: {time_color}; font-weight: bold;'>{minutes:02d}:{seconds:02d}</span></p>"
+        if WARD_MODE and WARD and GAME_STATE == "playing":
+            html_content += f"<p style='margin: 5px 10px;'><strong>Ward:</strong> {len(WARD['beds'])} patients</p>"
+            urgent_bed = ward_peek(WARD)
+            if urgent_bed and urgent_bed['patient']['time_bound']:
+                urgent_left = max(0, urgent_bed['deadline'] - time.time())
+                minutes, seconds = divmod(int(urgent_left), 60)
+                html_content += f"<p style='margin: 5px 10px;'><strong>Most Urgent:</strong> Bed {urgent_bed['bed_id']} ({urgent_bed['patient']['id']}) <span style='color: red; font-weight: bold;'>{minutes:02d}:{seconds:02d}</span></p>"
         html_content += "</div></div>"
         display(HTML(html_content))
 
@@ -290,24 +777,11 @@ def display_patient_info():
     with patient_info_output:
         clear_output(wait=True)
         if CURRENT_PATIENT:
-            html_content = f"""
-            <div style="border: 1px solid #cce; padding: 15px; border-radius: 12px; background-color: #eef; font-family: 'Inter', sans-serif; box-shadow: 2px 2px 5px rgba(0,0,0,0.1);">
-                <h3 style="margin-top: 0; color: #336; text-align: center; font-size: 1.3em;">Patient Case: {CURRENT_PATIENT['id']} - {CURRENT_PATIENT['theme']} (Difficulty: {CURRENT_PATIENT['difficulty']})</h3>
-                <p style="font-size: 1.1em; line-height: 1.5;"><strong>Initial Symptoms:</strong> {CURRENT_PATIENT['symptoms']}</p>
-                <div style="margin-top: 15px;">
-                    <p style="font-weight: bold; font-size: 1.1em;">Available Tests (Cost):</p>
-                    <ul style="list-style-type: none; padding-left: 0;">
-                        {''.join([f"<li style='margin-bottom: 5px;'>🔬 {test} <span style='color: #888;'>($<span style='font-weight: bold;'>{CURRENT_PATIENT['test_costs'][test]}</span>)</span></li>" for test in CURRENT_PATIENT['tests_available']])}
-                    </ul>
-                </div>
-                <p style="font-style: italic; color: #555; font-size: 0.9em; margin-top: 15px;">
-                    (Hint: Be careful with over-testing! Each unnecessary test will cost you credits if your final diagnosis/treatment is wrong. Focus on relevant tests.)
-                </p>
-            </div>
-            """
+            html_content = case_artifact(CURRENT_PATIENT, 'patient_panel_html')
             display(HTML(html_content))
-            test_dropdown.options = CURRENT_PATIENT['tests_available']
-            test_dropdown.value = CURRENT_PATIENT['tests_available'][0] if CURRENT_PATIENT['tests_available'] else None
+            test_options = case_artifact(CURRENT_PATIENT, 'test_options')
+            test_dropdown.options = test_options
+            test_dropdown.value = test_options[0] if test_options else None
         else:
             display(HTML("<p style='text-align: center; color: #666;'>No patient loaded. Click 'Start New Game' to begin.</p>"))
 
@@ -340,7 +814,14 @@ def display_message(message, message_type='info'):
 def check_time_limit():
     """Checks if time limit has been exceeded for time-bound levels."""
     global GAME_STATE
-    if CURRENT_PATIENT and CURRENT_PATIENT['time_bound'] and GAME_STATE == "playing":
+    if WARD_MODE and WARD and GAME_STATE == "playing":
+        # Any emergency on the ward can run out, not just the patient being treated
+        expired_bed = ward_first_expired(WARD)
+        if expired_bed:
+            display_message(f"Time's up for Bed {expired_bed['bed_id']} ({expired_bed['patient']['id']})! You failed to diagnose/treat in time.", 'error')
+            end_level(False, "Time's up!")
+            return True
+    elif CURRENT_PATIENT and CURRENT_PATIENT['time_bound'] and GAME_STATE == "playing":
         time_elapsed = time.time() - START_TIME
         if time_elapsed >= TIME_LIMIT_SECONDS:
             display_message("Time's up! You failed to diagnose/treat in time.", 'error')
@@ -348,9 +829,16 @@ def check_time_limit():
             return True
     return False
 
+def _timer_needed():
+    """Returns True while some patient in play is on the clock."""
+    if WARD_MODE and WARD:
+        urgent_bed = ward_peek(WARD)
+        return bool(urgent_bed and urgent_bed['patient']['time_bound'])
+    return bool(CURRENT_PATIENT and CURRENT_PATIENT['time_bound'])
+
 def _timer_update_loop():
     """Continuously updates the time display for time-bound levels."""
-    while not timer_stop_event.is_set() and GAME_STATE == "playing" and CURRENT_PATIENT and CURRENT_PATIENT['time_bound']:
+    while not timer_stop_event.is_set() and GAME_STATE == "playing" and _timer_needed():
         update_status_display()
         time.sleep(1) # Update every second
         if check_time_limit():
@@ -360,7 +848,7 @@ def _timer_update_loop():
 
 def start_game(b=None):
     """Initializes a new game session."""
-    global GAME_CREDITS, HINTS_AVAILABLE, CURRENT_LEVEL, SCORE, GAME_STATE
+    global GAME_CREDITS, HINTS_AVAILABLE, CURRENT_LEVEL, SCORE, GAME_STATE, SESSION_LIBRARY
     global remaining_basic_patients, remaining_mid_patients, remaining_advanced_patients
     global timer_thread, timer_stop_event
 
@@ -377,12 +865,16 @@ def start_game(b=None):
     SCORE = 0
     GAME_STATE = "playing"
 
-    # Populate patient pools for current game session (shallow copy to avoid modifying original PATIENT_DATA)
-    remaining_basic_patients = [p for p in PATIENT_DATA if p['difficulty'] == 'Basic']
+    # Pin the case library version for this game; later reloads only affect new games
+    SESSION_LIBRARY = CASE_LIBRARY
+    cases = SESSION_LIBRARY['cases']
+
+    # Populate patient pools for current game session
+    remaining_basic_patients = [cases[case_id] for case_id in SESSION_LIBRARY['by_difficulty'].get('Basic', ())]
     random.shuffle(remaining_basic_patients)
-    remaining_mid_patients = [p for p in PATIENT_DATA if p['difficulty'] == 'Mid-level']
+    remaining_mid_patients = [cases[case_id] for case_id in SESSION_LIBRARY['by_difficulty'].get('Mid-level', ())]
     random.shuffle(remaining_mid_patients)
-    remaining_advanced_patients = [p for p in PATIENT_DATA if p['difficulty'] == 'Advanced']
+    remaining_advanced_patients = [cases[case_id] for case_id in SESSION_LIBRARY['by_difficulty'].get('Advanced', ())]
     random.shuffle(remaining_advanced_patients)
 
     display_message("Welcome to Diagnostica! A new game has started. Good luck, Intern!", 'info')
@@ -390,6 +882,7 @@ def start_game(b=None):
     # Enable/Disable buttons based on initial state
     start_button.description = "Start New Game" # Reset button text
     start_button.disabled = True # Disable until a level is completed or game over
+    ward_button.disabled = True
     hint_button.description = f"Use Hint ({HINTS_AVAILABLE} left)"
     hint_button.disabled = False
     diagnose_button.disabled = False
@@ -399,7 +892,12 @@ def start_game(b=None):
     diagnosis_input.disabled = False
     treatment_input.disabled = True # Treatment input disabled until diagnosis is correct
 
-    load_new_patient()
+    if WARD_MODE:
+        admit_ward_patients()
+    else:
+        ward_dropdown.options = []
+        ward_dropdown.disabled = True
+        load_new_patient()
 
 
 def load_new_patient():
@@ -480,13 +978,9 @@ def order_test_handler(b):
     with game_output:
         clear_output(wait=True)
         display_message(f"🔬 Ordered {test_name}. Cost: ${cost}. Remaining Credits: ${GAME_CREDITS}", 'info')
-        if test_name in CURRENT_PATIENT['test_results']:
-            display(HTML(f"""
-            <div style="border: 1px solid #d4edda; padding: 15px; margin-top: 15px; border-radius: 12px; background-color: #e6faed; font-family: 'Inter', sans-serif; color: #155724; box-shadow: 2px 2px 5px rgba(0,0,0,0.1);">
-                <p style="font-weight: bold; font-size: 1.1em;">{test_name} Results:</p>
-                <p style="font-size: 1em; line-height: 1.4;">{CURRENT_PATIENT['test_results'][test_name]}</p>
-            </div>
-            """))
+        test_result_html = case_artifact(CURRENT_PATIENT, 'test_result_html')
+        if test_name in test_result_html:
+            display(HTML(test_result_html[test_name]))
         else:
             display_message(f"⚠️ No specific result found for {test_name} for this patient. This test might be unnecessary for this case, incurring a penalty if diagnosis/treatment is wrong later.", 'warning')
             # For simplicity, we apply a direct penalty for potentially unnecessary tests at the time of diagnosis/treatment review.
@@ -528,7 +1022,7 @@ def make_diagnosis_handler(b):
         return
 
     # Basic string matching for simplicity. For a real game, fuzzy matching or keyword recognition would be needed.
-    if submitted_diagnosis.lower() == CURRENT_PATIENT['correct_diagnosis'].lower():
+    if submitted_diagnosis.lower() == case_artifact(CURRENT_PATIENT, 'normalized_answers')['diagnosis']:
         SCORE += 100
         GAME_CREDITS += 200 # Bonus for correct diagnosis
         display_message(f"✅ Correct Diagnosis! You earned 100 points and ${200} bonus. Now administer the correct treatment.", 'success')
@@ -540,6 +1034,8 @@ def make_diagnosis_handler(b):
         treat_button.disabled = False
         test_dropdown.disabled = True # Disable further tests once diagnosis is made
         order_test_button.disabled = True
+        if WARD_MODE and WARD_ACTIVE_BED in WARD['beds']:
+            WARD['beds'][WARD_ACTIVE_BED]['phase'] = 'treatment' # Remembered when switching between patients
     else:
         GAME_CREDITS -= 100 # Penalty for wrong diagnosis
         display_message(f"❌ Incorrect Diagnosis. You lost 100 credits. Remaining Credits: ${GAME_CREDITS}. Please re-evaluate and try again!", 'warning')
@@ -564,7 +1060,7 @@ def administer_treatment_handler(b):
         return
 
     # Basic string matching for simplicity.
-    if submitted_treatment.lower() == CURRENT_PATIENT['correct_treatment'].lower():
+    if submitted_treatment.lower() == case_artifact(CURRENT_PATIENT, 'normalized_answers')['treatment']:
         SCORE += 150 # More points for correct treatment
         GAME_CREDITS += 300 # Bonus for correct treatment
         display_message(f"🎉 Correct Treatment! You earned 150 points and ${300} bonus. Patient successfully treated! Well done, Doctor!", 'success')
@@ -581,9 +1077,13 @@ def end_level(success, reason):
     global CURRENT_LEVEL, GAME_STATE, GAME_CREDITS, SCORE
     global timer_thread, timer_stop_event
 
+    if WARD_MODE and success:
+        discharge_ward_patient(reason) # Other ward patients keep their clocks running
+        return
+
     # Stop the timer thread if it's running
     timer_stop_event.set()
-    if timer_thread and timer_thread.is_alive():
+    if timer_thread and timer_thread.is_alive() and timer_thread is not threading.current_thread():
         timer_thread.join(timeout=1) # Give it a moment to stop
 
 
@@ -617,6 +1117,7 @@ def end_level(success, reason):
         return
 
     start_button.disabled = False # Enable start button for next action (next patient/level/new game)
+    ward_button.disabled = False
 
 
 def end_game(is_win, reason="Game Over"):
@@ -632,6 +1133,7 @@ def end_game(is_win, reason="Game Over"):
     treat_button.disabled = True
     hint_button.disabled = True
     order_test_button.disabled = True
+    ward_dropdown.disabled = True
 
     if is_win:
         display_message(f"🏆 Congratulations! You've mastered Diagnostica! Final Score: {SCORE}. {reason}", 'success')
@@ -640,11 +1142,12 @@ def end_game(is_win, reason="Game Over"):
 
     start_button.description = "Start New Game"
     start_button.disabled = False # Always re-enable start button to allow new game
+    ward_button.disabled = False
 
 
 def next_action_handler(b):
     """Handles the action when the start_button is clicked (next patient, next level, or new game)."""
-    global GAME_STATE
+    global GAME_STATE, WARD_MODE
     if GAME_STATE == "level_complete":
         # Determine if we're advancing patient within same level or moving to next difficulty
         if (CURRENT_LEVEL == 1 and remaining_basic_patients) or \
@@ -661,14 +1164,108 @@ def next_action_handler(b):
             # All levels/patients are exhausted
             end_game(True, "All cases completed!")
     else: # Initial start or game over, just start a fresh game.
+        WARD_MODE = False
         start_game()
 
+
+def start_ward_shift(b=None):
+    """Starts a ward shift where every case is admitted at once."""
+    global WARD_MODE
+    WARD_MODE = True
+    start_game()
+
+
+def admit_ward_patients():
+    """Admits all cases to a fresh ward and starts the shared ward timer."""
+    global WARD, WARD_ACTIVE_BED, timer_thread
+
+    WARD = new_ward()
+    WARD_ACTIVE_BED = None
+    now = time.time()
+    patients = list(SESSION_LIBRARY['cases'].values())
+    for patient in random.sample(patients, len(patients)):
+        ward_admit(WARD, patient, now)
+
+    emergencies = sum(1 for bed in WARD['beds'].values() if bed['patient']['time_bound'])
+    ward_dropdown.disabled = False
+    refresh_ward_dropdown()
+    display_message(f"🏥 Ward shift started! {len(WARD['beds'])} patients admitted, {emergencies} of them TIME-BOUND emergencies. Triage wisely! 🚨", 'warning')
+
+    # One timer per ward, however many patients are on the clock
+    if _timer_needed():
+        timer_stop_event.clear()
+        timer_thread = threading.Thread(target=_timer_update_loop)
+        timer_thread.daemon = True
+        timer_thread.start()
+
+
+def refresh_ward_dropdown():
+    """Rebuilds the ward list in triage order and keeps a patient selected."""
+    ward_dropdown.options = [
+        (f"Bed {bed['bed_id']}: {bed['patient']['id']} ({bed['patient']['difficulty']}){' 🚨' if bed['patient']['time_bound'] else ''}", bed['bed_id'])
+        for bed in ward_triage_order(WARD)
+    ]
+    urgent_bed = ward_peek(WARD)
+    if urgent_bed and WARD_ACTIVE_BED not in WARD['beds']:
+        ward_dropdown.value = urgent_bed['bed_id']
+        select_ward_bed(urgent_bed['bed_id']) # No-op if the value change already selected it
+
+
+def select_ward_bed(bed_id):
+    """Switches the controls to the patient in the given bed."""
+    global CURRENT_PATIENT, START_TIME, TIME_LIMIT_SECONDS, WARD_ACTIVE_BED
+    if GAME_STATE != "playing" or not WARD or bed_id == WARD_ACTIVE_BED or bed_id not in WARD['beds']:
+        return
+
+    bed = WARD['beds'][bed_id]
+    WARD_ACTIVE_BED = bed_id
+    CURRENT_PATIENT = bed['patient']
+    START_TIME = bed['admitted_at']
+    TIME_LIMIT_SECONDS = CURRENT_PATIENT['time_limit_seconds']
+
+    # Restore the phase this patient was left in
+    in_treatment = bed['phase'] == 'treatment'
+    diagnosis_input.value = ''
+    treatment_input.value = ''
+    diagnose_button.disabled = in_treatment
+    diagnosis_input.disabled = in_treatment
+    test_dropdown.disabled = in_treatment
+    order_test_button.disabled = in_treatment
+    treat_button.disabled = not in_treatment
+    treatment_input.disabled = not in_treatment
+
+    display_patient_info()
+    update_status_display()
+
+
+def discharge_ward_patient(reason):
+    """Discharges the treated patient and moves on to the next most urgent one."""
+    global WARD_ACTIVE_BED
+    treated_bed = WARD_ACTIVE_BED
+    ward_discharge(WARD, treated_bed)
+    WARD_ACTIVE_BED = None
+
+    if not WARD['beds']:
+        end_game(True, "Ward shift complete! Every patient was treated.")
+        return
+
+    refresh_ward_dropdown()
+    display_message(f"{reason} Bed {treated_bed} discharged. {len(WARD['beds'])} patients remain on the ward.", 'success')
+
+
+def ward_selection_handler(change):
+    """Handles the player picking a different patient from the ward list."""
+    if change['new'] is not None:
+        select_ward_bed(change['new'])
+
 # --- Widget Event Linking ---
 start_button.on_click(next_action_handler) # All start/continue logic goes through this handler
 hint_button.on_click(use_hint_handler)
 diagnose_button.on_click(make_diagnosis_handler)
 treat_button.on_click(administer_treatment_handler)
 order_test_button.on_click(order_test_handler)
+ward_button.on_click(start_ward_shift)
+ward_dropdown.observe(ward_selection_handler, names='value')
 
 
 # --- Initial GUI Setup ---
@@ -678,6 +1275,7 @@ def setup_gui():
 
     # Arrange buttons and inputs for actions
     action_controls = widgets.VBox([
+        ward_dropdown,
         widgets.HBox([test_dropdown, order_test_button], layout=widgets.Layout(justify_content='space-between')),
         diagnosis_input,
         diagnose_button,
@@ -693,7 +1291,7 @@ def setup_gui():
                 <span style='color: #3498db;'>🩺 Diagnostica:</span> Virtual Medical Case Simulator 🔬
             </h1>
         """),
-        widgets.HBox([start_button], layout=widgets.Layout(justify_content='center', margin='10px 0 20px 0')),
+        widgets.HBox([start_button, ward_button], layout=widgets.Layout(justify_content='center', margin='10px 0 20px 0')),
         status_output,
         patient_info_output,
         game_output,
@@ -703,6 +1301,7 @@ def setup_gui():
     ], layout=widgets.Layout(border='2px solid #a0a0a0', padding='25px', border_radius='20px', background_color='#ffffff', box_shadow='5px 5px 15px rgba(0,0,0,0.2)', max_width='800px', margin='auto'))
 
     display(game_container)
+    start_case_pack_watcher()
     update_status_display()
     display_message("Click 'Start New Game' to begin your biomedical internship!", 'info')
 